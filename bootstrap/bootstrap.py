@@ -1,4 +1,3 @@
-import uvicorn
 from injector import Injector, Module, singleton
 
 from domain.db_manager_interface import DBManagerInterface
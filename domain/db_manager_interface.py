@@ -11,10 +11,6 @@ class DBManagerInterface(ABC):
     def commit(self) -> None:
         raise NotImplementedError
 
-    @abstractmethod
-    def refresh(self, obj: Any) -> None:
-        raise NotImplementedError
-
     @abstractmethod
     def filter_query(self, model: Any, value_to_compare: Any, comparison_target) -> Any:
         raise NotImplementedError
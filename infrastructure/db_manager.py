@@ -1,33 +1,51 @@
 from typing import Any
 
 from injector import inject
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, select
 
 from domain.db_manager_interface import DBManagerInterface
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.orm import Session, scoped_session, sessionmaker
 
 from domain.secrets_manager_interface import SecretsManagerInterface
 from infrastructure.models import Base
 
+# Sized for FastAPI's default threadpool (40 threads) per worker; Postgres
+# max_connections must cover (POOL_SIZE + MAX_OVERFLOW) * worker count.
+POOL_SIZE = 10
+MAX_OVERFLOW = 30
+POOL_RECYCLE_SECONDS = 1800
+
 
 class DBManager(DBManagerInterface):
     @inject
     def __init__(self, secrets_manager: SecretsManagerInterface):
         secret = secrets_manager.get_secret("url_database-1")
         database_url = f"{secret['engine']}://{secret['username']}:{secret['password']}@{secret['host']}:{secret['port']}/{secret['dbname']}"
-        engine = create_engine(database_url, connect_args={"connect_timeout": 20})
-        session_local = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+        engine = create_engine(
+            database_url,
+            connect_args={"connect_timeout": 20},
+            pool_size=POOL_SIZE,
+            max_overflow=MAX_OVERFLOW,
+            pool_recycle=POOL_RECYCLE_SECONDS,
+            pool_pre_ping=True,
+        )
+        self.session_local = sessionmaker(autocommit=False, autoflush=False, bind=engine)
         Base.metadata.create_all(bind=engine)
-        self.db: Session = session_local()
+        # FastAPI runs sync endpoints in a threadpool, so each thread gets its own session
+        self.db: scoped_session[Session] = scoped_session(self.session_local)
 
     def add(self, obj: Any):
         self.db.add(obj)
 
     def commit(self) -> None:
-        self.db.commit()
-
-    def refresh(self, obj: Any) -> None:
-        self.db.refresh(obj)
+        try:
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
 
     def filter_query(self, model: Any, value_to_compare: Base, comparison_target) -> Any:
-        return self.db.query(model).filter(value_to_compare == comparison_target).first()
+        statement = select(model).where(value_to_compare == comparison_target).limit(1)
+        # Reads get a short-lived session so the connection goes back to the pool right away
+        with self.session_local() as session:
+            return session.scalars(statement).first()
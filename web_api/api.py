@@ -1,10 +1,11 @@
+from functools import lru_cache
 from urllib.parse import urlparse
 
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import RedirectResponse
 
 from domain.models import URLRequest
-from domain.url_handler import URLHandler
+from domain.url_handler import URLHandler, URL_CACHE_SIZE
 from bootstrap.bootstrap import injector
 from fastapi import FastAPI, Request
 
@@ -19,6 +20,15 @@ app.add_middleware(
 url_handler: URLHandler = injector.get(URLHandler)
 
 
+@lru_cache(maxsize=URL_CACHE_SIZE)
+def _redirect_target(original_url: str) -> str:
+    parsed_url = urlparse(original_url)
+    if not parsed_url.scheme:
+        # Default to http if no scheme is provided
+        return "http://" + original_url
+    return original_url
+
+
 @app.post("/shorten/")
 def create_short_url(url_request: URLRequest, fastapi_request: Request):
     return url_handler.shorten_url(url_request=url_request, fastapi_request=fastapi_request)
@@ -27,8 +37,4 @@ def create_short_url(url_request: URLRequest, fastapi_request: Request):
 @app.get("/{short_url}")
 def redirect_to_url(short_url: str):
     original_url = url_handler.get_original_url(short_url=short_url)
-    parsed_url = urlparse(original_url)
-    if not parsed_url.scheme:
-        # Default to http if no scheme is provided
-        original_url = "http://" + original_url
-    return RedirectResponse(url=original_url)
+    return RedirectResponse(url=_redirect_target(original_url))